@@ -11,6 +11,8 @@ from datalad_core.constraints.constraint import Constraint
 class NoConstraint(Constraint):
     """A constraint that represents no constraints"""
 
+    _is_pure = True
+
     @property
     def input_synopsis(self):
         return ''
@@ -22,6 +24,8 @@ class NoConstraint(Constraint):
 class EnsureChoice(Constraint):
     """Ensure an input is element of a set of possible values"""
 
+    _is_pure = True
+
     def __init__(self, *values: Any):
         self._choices = tuple(values)
         super().__init__()
@@ -48,6 +52,8 @@ class EnsureChoice(Constraint):
 class EnsureMappingtHasKeys(Constraint):
     """Ensure a mapping has all given keys"""
 
+    _is_pure = True
+
     def __init__(self, required_keys: tuple | list):
         self._required_keys = required_keys
 
@@ -14,6 +14,8 @@ from typing import (
 from datalad_core.constraints.exceptions import ConstraintError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from datalad_core.commands import Dataset
 
 
@@ -22,10 +24,65 @@ class Constraint(ABC):
 
     These classes are also meant to be able to generate appropriate
     documentation on an appropriate parameter value.
+
+    Constraint classes can declare themselves as "pure" by setting the class
+    attribute ``_is_pure`` to ``True``. A pure constraint is deterministic,
+    free of side effects, and idempotent (applying it to its own output does
+    not change the output). Instances of pure constraint classes compare
+    equal, if they have the same type and parametrization, and duplicates
+    are removed when they are combined with :class:`AllOf` or
+    :class:`AnyOf`.
     """
 
+    # subclasses can declare their own slots, or get a `__dict__`
+    __slots__ = ()
+
+    _is_pure = False
+
+    # `str()` of a constraint class with a static `input_synopsis`
+    _str_cache: str | None = None
+
+    # whether a constraint class implements a dedicated `for_dataset()`
+    _has_for_dataset = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # a plain class attribute will not change, no need to rebuild the
+        # self-description on every call. Properties are left alone
+        synopsis = cls.input_synopsis
+        cls._str_cache = (
+            f'Constraint[{synopsis}]' if isinstance(synopsis, str) else None
+        )
+        # without a dedicated implementation, `for_dataset()` is known
+        # to return the identical instance
+        cls._has_for_dataset = cls.for_dataset is not Constraint.for_dataset
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not self._is_pure or type(self) is not type(other):
+            # fall back on identity
+            return NotImplemented
+        return self._get_state() == other._get_state()  # type: ignore
+
+    def __hash__(self) -> int:
+        if not self._is_pure:
+            return super().__hash__()
+        # equal constraints must have the same hash. The state need not be
+        # hashable, so we only go by type
+        return hash(type(self))
+
+    def _get_state(self) -> Any:
+        """Return the state that determines equality of pure constraints
+
+        The default implementation returns the instance's ``__dict__``.
+        """
+        return vars(self)
+
     def __str__(self) -> str:
         """Rudimentary self-description"""
+        if self._str_cache is not None:
+            return self._str_cache
         return f'Constraint[{self.input_synopsis}]'
 
     def __repr__(self) -> str:
@@ -103,14 +160,31 @@ class Constraint(ABC):
         # do any necessary checks or conversions, potentially catch exceptions
         # and generate a meaningful error message
 
+    def validate_many(self, values: Iterable[Any]) -> list[Any]:
+        """Process a collection of values and return a list of results
+
+        The default implementation calls the constraint for each value in
+        order. Subclasses can implement a more efficient processing of
+        batches. A :class:`ConstraintError` is raised for the first value
+        that violates the constraint, no results are returned in this case.
+        """
+        return [self(v) for v in values]
+
 
 class _MultiConstraint(Constraint):
     """Helper class to override the description methods to reported
     multiple constraints
     """
 
+    __slots__ = ('_constraints',)
+
     def __init__(self, *constraints: Constraint):
-        self._constraints = constraints
+        self._constraints = self._simplify(constraints)
+
+    @staticmethod
+    def _simplify(constraints: tuple[Constraint, ...]) -> tuple[Constraint, ...]:
+        """Remove redundant constraints, no-op by default"""
+        return constraints
 
     def __repr__(self) -> str:
         creprs = ', '.join(f'{c!r}' for c in self.constraints)
@@ -132,10 +206,16 @@ class _MultiConstraint(Constraint):
     def for_dataset(self, dataset: Dataset) -> Constraint:
         """Return a constraint-variant for a specific dataset context
 
-        The default implementation returns the unmodified, identical
-        constraint. However, subclasses can implement different behaviors.
+        All constraints are tailored individually. If none of them
+        is changed by this, the unmodified, identical instance is returned.
         """
-        return self.__class__(*(c.for_dataset(dataset) for c in self.constraints))
+        constraints = self._constraints
+        if not any(c._has_for_dataset for c in constraints):  # noqa: SLF001
+            return self
+        tailored = tuple(c.for_dataset(dataset) for c in constraints)
+        if all(t is c for t, c in zip(tailored, constraints)):
+            return self
+        return self.__class__(*tailored)
 
 
 class AnyOf(_MultiConstraint):
@@ -146,8 +226,22 @@ class AnyOf(_MultiConstraint):
     constraint that does not raise an exception is the global return value.
 
     Documentation is aggregated for all alternative constraints.
+
+    Any repeated pure constraint is only considered once. It would fail in
+    the same way for the same value.
     """
 
+    __slots__ = ()
+
+    @staticmethod
+    def _simplify(constraints: tuple[Constraint, ...]) -> tuple[Constraint, ...]:
+        simplified: list[Constraint] = []
+        for c in constraints:
+            if c._is_pure and c in simplified:  # noqa: SLF001
+                continue
+            simplified.append(c)
+        return tuple(simplified)
+
     def __or__(self, other: Constraint) -> Constraint:
         constraints = list(self.constraints)
         if isinstance(other, AnyOf):
@@ -157,12 +251,18 @@ class AnyOf(_MultiConstraint):
         return AnyOf(*constraints)
 
     def __call__(self, value: Any) -> Any:
-        e_list = []
-        for c in self.constraints:
+        # only allocated on the first failure, the common case is
+        # that some alternative matches
+        e_list: list[Exception] | None = None
+        # iterate over the tuple directly, not via the property
+        for c in self._constraints:
             try:
                 return c(value)
             except Exception as e:  # noqa: BLE001
-                e_list.append(e)
+                if e_list is None:
+                    e_list = [e]
+                else:
+                    e_list.append(e)
         self.raise_for(  # noqa: RET503
             value,
             # plural OK, no sense in having 1 "alternative"
@@ -194,8 +294,23 @@ class AllOf(_MultiConstraint):
     is the global return value. No intermediate exceptions are caught.
 
     Documentation is aggregated for all constraints.
+
+    Consecutive repetitions of a pure constraint are only applied once.
+    Because each constraint receives the output of its predecessor, a
+    non-consecutive repetition is kept.
     """
 
+    __slots__ = ()
+
+    @staticmethod
+    def _simplify(constraints: tuple[Constraint, ...]) -> tuple[Constraint, ...]:
+        simplified: list[Constraint] = []
+        for c in constraints:
+            if c._is_pure and simplified and simplified[-1] == c:  # noqa: SLF001
+                continue
+            simplified.append(c)
+        return tuple(simplified)
+
     def __and__(self, other: Constraint) -> Constraint:
         constraints = list(self.constraints)
         if isinstance(other, AllOf):
@@ -205,10 +320,23 @@ class AllOf(_MultiConstraint):
         return AllOf(*constraints)
 
     def __call__(self, value: Any) -> Any:
-        for c in self.constraints:
+        # iterate over the tuple directly, not via the property
+        for c in self._constraints:
             value = c(value)
         return value
 
+    def validate_many(self, values: Iterable[Any]) -> list[Any]:
+        """Process a collection of values, one constraint at a time
+
+        Each constraint processes the full batch of the previous one's
+        results. Consequently, when multiple values are invalid, the reported
+        one need not be the first in the collection.
+        """
+        results = list(values)
+        for c in self._constraints:
+            results = c.validate_many(results)
+        return results
+
     @property
     def input_synopsis(self) -> str:
         return self._get_description('input_synopsis', 'and')
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import ChainMap
+from functools import cached_property
 from textwrap import indent
 from types import MappingProxyType
 from typing import (
@@ -57,7 +59,7 @@ class ConstraintError(ValueError):
         # `ValueError` would have it. Everything else goes after it.
         super().__init__(msg, constraint, value, ctx)
 
-    @property
+    @cached_property
     def msg(self):
         """Obtain an (interpolated) message on the constraint violation
 
@@ -73,21 +75,22 @@ class ConstraintError(ValueError):
         Message template can use any feature of the Python format mini
         language. For example ``{__value__!r}`` to get a ``repr()``-style
         representation of the offending value.
+
+        The message is only interpolated on first access. Errors that are
+        caught and discarded never pay for it.
         """
         msg_tmpl = self.args[0]
-        # get interpolation values for message formatting
-        # we need a copy, because we need to mutate the dict
-        ctx = dict(self.context)
         # support a few standard placeholders
         # the verbatim value that caused the error: with !r and !s both
         # types of stringifications are accessible
-        ctx['__value__'] = self.value
-        if self.caused_by:
-            ctx['__itemized_causes__'] = indent(
-                '\n'.join(f'- {c!s}' for c in self.caused_by),
-                '  ',
-            )
-        return msg_tmpl.format(**ctx)
+        std: dict[str, Any] = {'__value__': self.value}
+        caused_by = self.caused_by
+        if caused_by:
+            # only rendered, if the template actually uses it
+            std['__itemized_causes__'] = _ItemizedCauses(caused_by)
+        # layer the standard placeholders over the error context,
+        # no need to copy it
+        return msg_tmpl.format_map(ChainMap(std, self.args[3] or {}))
 
     @property
     def constraint(self):
@@ -128,3 +131,24 @@ class ConstraintError(ValueError):
             self.__class__.__name__,
             *self.args,
         )
+
+
+class _ItemizedCauses:
+    """Indented bullet list of exceptions, rendered on demand"""
+
+    __slots__ = ('_causes',)
+
+    def __init__(self, causes: tuple[Exception, ...]):
+        self._causes = causes
+
+    def __str__(self) -> str:
+        return indent(
+            '\n'.join(f'- {c!s}' for c in self._causes),
+            '  ',
+        )
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
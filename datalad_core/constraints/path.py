@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+from functools import lru_cache
 from pathlib import (
     Path,
     PurePath,
@@ -16,7 +17,6 @@ if TYPE_CHECKING:
 
 from datalad_core.constraints.constraint import Constraint
 from datalad_core.consts import UnsetValue
-from datalad_core.repo import Worktree
 
 
 class EnsurePath(Constraint):
@@ -26,6 +26,8 @@ class EnsurePath(Constraint):
     or relative.
     """
 
+    _is_pure = True
+
     def __init__(
         self,
         *,
@@ -68,29 +70,75 @@ class EnsurePath(Constraint):
         self._is_mode = is_mode
         self._ref = ref
         self._ref_is = ref_is
+        if self._is_format not in (None, 'absolute', 'relative'):
+            msg = f'unrecognized `is_format` label: {self._is_format}'
+            raise ValueError(msg)
         if self._ref_is not in ('parent-or-same-as', 'parent-of'):
             msg = f'unrecognized `ref_is` operation label: {self._ref_is}'
             raise ValueError(msg)
 
+        # the parametrization is fixed. Determine the checks that are
+        # actually needed once here, rather than evaluating all
+        # conditions on each call
+        checks: list[Callable[[EnsurePath, PurePath | Path], None]] = []
+        # we are testing the format first, because resolve_path()
+        # will always turn things into absolute paths
+        if self._is_format == 'absolute':
+            checks.append(EnsurePath._check_is_absolute)
+        elif self._is_format == 'relative':
+            checks.append(EnsurePath._check_is_relative)
+        if self._lexists is not None or self._is_mode is not None:
+            checks.append(EnsurePath._check_lstat)
+        if self._ref:
+            checks.append(
+                EnsurePath._check_ref_parent_of
+                if self._ref_is == 'parent-of'
+                else EnsurePath._check_ref_parent_or_same_as
+            )
+        self._checks = tuple(checks)
+
+    def _get_state(self) -> Any:
+        # the check functions are derived from these parameters
+        return (
+            self._path_type,
+            self._is_format,
+            self._lexists,
+            self._is_mode,
+            self._ref,
+            self._ref_is,
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cache of path instances converted from ``str`` input
+
+        Conversion results are cached, because the same paths are commonly
+        validated repeatedly. Only the type conversion is cached, any
+        checks of path properties are performed on every call.
+        """
+        _get_cached_path_instance.cache_clear()
+
     def __call__(self, value: Any) -> PurePath | Path:
         # turn it into the target type to make everything below
         # more straightforward
         path = get_path_instance(self, value)
+        for check in self._checks:
+            check(self, path)
+        return path
 
-        # we are testing the format first, because resolve_path()
-        # will always turn things into absolute paths
-        if self._is_format is not None:
-            is_abs = path.is_absolute()
-            if self._is_format == 'absolute' and not is_abs:
-                self.raise_for(path, 'is not an absolute path')
-            elif self._is_format == 'relative' and is_abs:
-                self.raise_for(path, 'is not a relative path')
+    def _check_is_absolute(self, path: PurePath | Path) -> None:
+        if not path.is_absolute():
+            self.raise_for(path, 'is not an absolute path')
+
+    def _check_is_relative(self, path: PurePath | Path) -> None:
+        if path.is_absolute():
+            self.raise_for(path, 'is not a relative path')
 
+    def _check_lstat(self, path: PurePath | Path) -> None:
         mode = None
-        if self._lexists is not None or self._is_mode is not None:
-            with contextlib.suppress(FileNotFoundError):
-                # error would be OK, handled below
-                mode = path.lstat().st_mode if hasattr(path, 'lstat') else UnsetValue
+        with contextlib.suppress(FileNotFoundError):
+            # error would be OK, handled below
+            mode = path.lstat().st_mode if hasattr(path, 'lstat') else UnsetValue
         if self._lexists is not None:
             if self._lexists and mode is None:
                 self.raise_for(path, 'does not exist')
@@ -101,26 +149,22 @@ class EnsurePath(Constraint):
                 self.raise_for(path, 'cannot check mode, PurePath given')
             elif not self._is_mode(mode):
                 self.raise_for(path, 'does not match desired mode')
-        if self._ref:
-            ok = True
-            if self._ref_is == 'parent-or-same-as':
-                ok = path == self._ref or self._ref in path.parents
-            elif self._ref_is == 'parent-of':
-                ok = self._ref in path.parents
-            else:  # pragma: no cover
-                # this code cannot be reached with normal usage.
-                # it is prevented by an assertion in __init__()
-                msg = f'unknown `ref_is` operation label {self._ref_is!r}'
-                raise RuntimeError(msg)
-
-            if not ok:
-                self.raise_for(
-                    path,
-                    '{ref} is not {ref_is} {path}',
-                    ref=self._ref,
-                    ref_is=self._ref_is,
-                )
-        return path
+
+    def _check_ref_parent_or_same_as(self, path: PurePath | Path) -> None:
+        if path != self._ref and self._ref not in path.parents:
+            self._raise_for_ref(path)
+
+    def _check_ref_parent_of(self, path: PurePath | Path) -> None:
+        if self._ref not in path.parents:
+            self._raise_for_ref(path)
+
+    def _raise_for_ref(self, path: PurePath | Path) -> None:
+        self.raise_for(
+            path,
+            '{ref} is not {ref_is} {path}',
+            ref=self._ref,
+            ref_is=self._ref_is,
+        )
 
     @property
     def input_synopsis(self):
@@ -162,13 +206,20 @@ class EnsureDatasetPath(Constraint):
         Otherwise, all given paths are interpreted as-is, or relative to
         the current working directory (CWD).
         """
+        # import here to avoid pulling in the entire repo/config/runner
+        # machinery on import, when only plain value constraints are needed
+        from datalad_core.repo import Worktree
+
         self._path_constraint = path_constraint
         self._dataset = dataset
+        # the pristine spec is fixed, determine once whether we need to
+        # deviate from EnsurePath()
+        self._from_worktree = isinstance(dataset.pristine_spec, Worktree)
 
     def __call__(self, value: Any) -> PurePath | Path:
         # only if the Dataset instance was created from a Worktree
         # instance we deviate from EnsurePath()
-        if value is not None and not isinstance(self._dataset.pristine_spec, Worktree):
+        if value is not None and not self._from_worktree:
             return self._path_constraint(value)
 
         path = (
@@ -192,11 +243,24 @@ def get_path_instance(
     origin_constraint: EnsurePath,
     value: Any,
 ) -> PurePath | Path:
+    path_type = origin_constraint._path_type  # noqa: SLF001
     try:
-        path = origin_constraint._path_type(value)  # noqa: SLF001
+        # only `str` input is cached. Other types are not necessarily
+        # immutable (os.PathLike), or do not compare with all-identical
+        # semantics (case-insensitive PureWindowsPath)
+        path = (
+            _get_cached_path_instance(value, path_type)
+            if type(value) is str
+            else path_type(value)
+        )
     except (ValueError, TypeError) as e:
         origin_constraint.raise_for(
             value,
             str(e),
         )
     return path
+
+
+@lru_cache(maxsize=256)
+def _get_cached_path_instance(value: str, path_type: type) -> PurePath | Path:
+    return path_type(value)
@@ -141,3 +141,46 @@ def test_constraint_for_dataset():
     # without a dedicated implementation there is no transformation
     c = BecomesB()
     assert c.for_dataset(Dataset(None)) is c
+    # same for a MultiConstraint
+    ca = AllOf(BecomesB(), c)
+    assert ca.for_dataset(Dataset(None)) is ca
+    # also when a member has an implementation, but it changes nothing
+    ca = AllOf(BecomesB(), AllOf(c))
+    assert ca.for_dataset(Dataset(None)) is ca
+
+
+def test_constraint_pure_dedup():
+    class PureInt(EnsureInt):
+        _is_pure = True
+
+    class PureIsTrue(IsTrue):
+        _is_pure = True
+
+    # pure constraints compare by type and parametrization
+    assert PureInt() == PureInt()
+    assert hash(PureInt()) == hash(PureInt())
+    assert PureInt() != PureIsTrue()
+    # non-pure ones by identity
+    assert EnsureInt() != EnsureInt()
+
+    # repeated alternatives are only considered once
+    c = PureIsTrue() | PureInt() | PureIsTrue()
+    assert c.constraints == (PureIsTrue(), PureInt())
+    assert (PureIsTrue() | PureIsTrue()).constraints == (PureIsTrue(),)
+
+    # only consecutive repetitions are dropped for AllOf
+    c = PureInt() & PureInt() & Equals5()
+    assert len(c.constraints) == 2  # noqa: PLR2004
+    assert c('5') == 5  # noqa: PLR2004
+    c = PureInt() & Equals5() & PureInt()
+    assert len(c.constraints) == 3  # noqa: PLR2004
+
+
+def test_constraint_validate_many():
+    assert IsTrue().validate_many([True, True]) == [True, True]
+    int5 = EnsureInt() & Equals5()
+    assert int5.validate_many(iter(['5', 5, 5.0])) == [5, 5, 5]
+    assert int5.validate_many([]) == []
+    with pytest.raises(ConstraintError, match='4 is not 5'):
+        int5.validate_many(['5', '4'])
+    assert (IsTrue() | Equals5()).validate_many([True, 5]) == [True, 5]
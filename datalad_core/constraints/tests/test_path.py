@@ -60,6 +60,21 @@ def test_EnsurePath(tmp_path):
     assert c.input_synopsis == f'path that is parent-of {target}'
     with pytest.raises(ValueError, match='unrecognized'):
         c = EnsurePath(ref=target, ref_is='stupid')
+    with pytest.raises(ValueError, match='unrecognized'):
+        c = EnsurePath(is_format='stupid')
+
+
+def test_EnsurePath_cache():
+    c = EnsurePath()
+    # str input conversion is cached
+    p = c('some/path')
+    assert c('some/path') is p
+    # cache is shared across instances with the same path type
+    assert EnsurePath()('some/path') is p
+    assert EnsurePath(path_type=PurePath)('some/path') is not p
+    EnsurePath.clear_cache()
+    assert c('some/path') == p
+    assert c('some/path') is not p
 
 
 def test_EnsurePath_fordataset(gitrepo):
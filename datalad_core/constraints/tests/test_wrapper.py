@@ -49,4 +49,6 @@ def test_withdescription():
     with pytest.raises(ConstraintError) as e:
         d(5)
     assert e.value.msg == error_message.format(__value__=5)
+    # the wrapper is reported as the violated constraint
+    assert e.value.constraint is d
     assert d(True) is True
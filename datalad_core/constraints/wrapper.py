@@ -14,6 +14,13 @@ class WithDescription(Constraint):
     description of valid inputs replaces those of the wrapped constraint.
     """
 
+    __slots__ = (
+        '_constraint',
+        '_synopsis',
+        '_description',
+        '_error_message',
+    )
+
     def __init__(
         self,
         constraint: Constraint,
@@ -72,12 +79,21 @@ class WithDescription(Constraint):
             # rewrap the error to get access to the top-level
             # self-description.
             msg, cnstr, value, ctx = e.args
-            raise ConstraintError(
-                self,
-                value,
-                self._error_message or msg,
-                ctx,
-            ) from e
+            if type(e) is not ConstraintError:
+                # subclasses may have different semantics, do not mutate
+                raise ConstraintError(
+                    self,
+                    value,
+                    self._error_message or msg,
+                    ctx,
+                ) from e
+            # update the caught exception in-place and reraise, rather
+            # than creating and chaining a new one. The wrapped constraint
+            # is replaced by this wrapper, just like in a new exception
+            e.args = (self._error_message or msg, self, value, ctx)
+            # drop any already interpolated message
+            vars(e).pop('msg', None)
+            raise
 
     def __repr__(self) -> str:
         return (
@@ -7,7 +7,7 @@ __all__ = [
     'PRE_INIT_COMMIT_SHA',
 ]
 
-from os.path import join as opj
+from os import sep
 
 from datasalad.settings import UnsetValue
 
@@ -16,7 +16,7 @@ DATALAD_DOTDIR_RELPATH = '.datalad'
 
 ``str`` path in platform conventions, relative to the root of the dataset.
 """
-DATALAD_BRANCH_CONFIG_RELPATH = opj(DATALAD_DOTDIR_RELPATH, 'config')
+DATALAD_BRANCH_CONFIG_RELPATH = f'{DATALAD_DOTDIR_RELPATH}{sep}config'
 """Path to the branch-specific DataLad configuration file in a dataset
 
 ``str`` path in platform conventions, relative to the root of the dataset.